@@ -3,8 +3,13 @@ import logging
 from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_CLOSE,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from yarl import URL
@@ -47,6 +52,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     shared = Shared(hass, base_url, credentials)
     # Override default intervals with user-configured values
     shared.state_coord.update_interval = state_interval
+    shared.config_interval = config_interval
     shared.config_coord.update_interval = config_interval
 
     await shared.async_config_entry_first_refresh()
@@ -54,6 +60,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = shared
 
+    async def _close_client(_event: Event) -> None:
+        await api.async_close_shared_client()
+
+    # the http client is shared between all devices, release it when HA shuts down
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _close_client)
+    )
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
@@ -76,6 +90,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         shared: Shared
         if shared := hass.data[DOMAIN].pop(entry.entry_id):
             await shared.async_shutdown()
+        if not hass.data[DOMAIN]:
+            # last device is gone, no need to keep the connection pool around
+            await api.async_close_shared_client()
 
     return unload_ok
 
@@ -1,20 +1,42 @@
 import asyncio
 import dataclasses
-import json
+import functools
 import logging
-import time
-from collections.abc import Callable
+import random
+from collections.abc import Awaitable, Callable, Sequence
 from datetime import UTC, datetime
 from typing import Any, Literal, TypedDict, cast
-import json_repair
 
 import httpx
+import orjson
 from yarl import URL
 
 from . import discovery  # noqa: F401 # type: ignore
 
 _LOGGER = logging.getLogger(__name__)
 
+_RETRY_MAX_DELAY = 30.0
+_RETRY_JITTER = 0.5
+# the appliances are low-powered embedded devices, don't flood them with requests
+_CONFIG_FETCH_CONCURRENCY = 4
+# shared instance for empty list responses. The results are only ever read,
+# so there's no need to allocate a new list on every poll.
+_EMPTY_LIST: Sequence[Any] = ()
+# response bodies larger than this (in bytes) are parsed off the event loop
+_INLINE_PARSE_LIMIT = 4096
+# endpoints that only exist on some devices. Once the device answered that it doesn't
+# support them, they're not requested again. Other endpoints can also fail with 404
+# for a while, ex. while the HH module reboots during a firmware update.
+_OPTIONAL_COMMANDS = frozenset({("hh", "getDeviceInfo"), ("hh", "getAllProgramIds")})
+# status codes with which devices answer commands they don't support
+_UNSUPPORTED_STATUS_CODES = frozenset(
+    {
+        httpx.codes.NOT_FOUND,
+        httpx.codes.METHOD_NOT_ALLOWED,
+        httpx.codes.NOT_IMPLEMENTED,
+    }
+)
+
 DeviceStatusInactiveT = Literal["true"] | Literal["false"]
 
 
@@ -59,23 +81,34 @@ class PushNotification(TypedDict, total=False):
     message: str
 
 
-class Command(TypedDict, total=False):
+@dataclasses.dataclass(slots=True, frozen=True, kw_only=True)
+class Command:
     type: (
         Literal["action"]
         | Literal["boolean"]
         | Literal["selection"]
         | Literal["status"]
         | Literal["range"]
-    )
-    description: str
-    command: str
-    value: str
-    alterable: bool
-    options: list[str]
-    minMax: tuple[str, str]
-    refresh: list[str]
+        | str
+    ) = ""
+    description: str = ""
+    command: str = ""
+    value: str | None = None
+    alterable: bool | None = None
+    """`None` if the device didn't say whether the command is alterable"""
+    options: list[str] = dataclasses.field(default_factory=list)
+    minMax: list[str] = dataclasses.field(default_factory=list)
+    refresh: list[str] = dataclasses.field(default_factory=list)
     """list of commands to refresh when this command is changed"""
 
+    @classmethod
+    def build(cls, raw: dict[str, Any]) -> "Command":
+        # unknown keys sent by newer firmware are dropped
+        return Command(**{key: raw[key] for key in _COMMAND_KEYS & raw.keys()})
+
+
+_COMMAND_KEYS = frozenset(field.name for field in dataclasses.fields(Command))
+
 
 HhFwVersion = TypedDict(
     "HhFwVersion",
@@ -164,6 +197,9 @@ class ProgramInfo(TypedDict, total=False):
     stepIds: list[int]
 
 
+_PROGRAM_INFO_KEYS = ProgramInfo.__required_keys__ | ProgramInfo.__optional_keys__
+
+
 @dataclasses.dataclass(slots=True, kw_only=True)
 class Program:
     info: ProgramInfo
@@ -171,16 +207,10 @@ class Program:
 
     @classmethod
     def build(cls, raw: dict[str, Any]) -> "Program":
-        info = {}
-        options = raw.copy()
-        for key in ProgramInfo.__required_keys__ | ProgramInfo.__optional_keys__:
-            # extract all ProgramInfo keys from 'options' to 'info'
-            try:
-                info[key] = options[key]
-            except LookupError:
-                pass
-            else:
-                del options[key]
+        # split all ProgramInfo keys off into 'info', the rest are options
+        info_keys = _PROGRAM_INFO_KEYS & raw.keys()
+        info = {key: raw[key] for key in info_keys}
+        options = {key: value for key, value in raw.items() if key not in info_keys}
         return Program(info=cast(ProgramInfo, info), options=options)
 
 
@@ -189,7 +219,7 @@ class AggState:
     zh_mode: int
     device: DeviceStatus
     device_fetched_at: datetime
-    notifications: list[PushNotification]
+    notifications: Sequence[PushNotification]
     eco_info: EcoInfo
 
 
@@ -200,6 +230,15 @@ class AggUpdateStatus:
     hh_fw_version: HhFwVersion
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_api_version(raw: str) -> tuple[int, ...]:
+    """Parse an api version like "1.7.0" into a comparable tuple.
+
+    Non-numeric parts (ex. a "-beta" suffix) are ignored instead of failing.
+    """
+    return tuple(int(part) for part in raw.split(".") if part.isdigit())
+
+
 @dataclasses.dataclass(slots=True, kw_only=True)
 class AggMeta:
     mac_address: str
@@ -240,6 +279,165 @@ class Credentials:
     password: str
 
 
+try:
+    import h2  # noqa: F401
+except ImportError:
+    _HTTP2_AVAILABLE = False
+else:
+    _HTTP2_AVAILABLE = True
+
+_shared_client: httpx.AsyncClient | None = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the HTTP client shared by all VZugApi instances.
+
+    A single connection pool is used for all devices. The client is created on
+    first use and again after it has been closed.
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        transport = httpx.AsyncHTTPTransport(
+            verify=False,
+            # multiplexes concurrent requests over one connection. Only negotiated
+            # via ALPN on https, devices without h2 support (and plain http) use HTTP/1.1
+            http2=_HTTP2_AVAILABLE,
+            # keep connections alive across polling intervals so consecutive
+            # refreshes don't pay for a new TCP (and TLS) handshake every time
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=16,
+                keepalive_expiry=75.0,
+            ),
+            retries=5,
+        )
+        _shared_client = httpx.AsyncClient(
+            transport=transport,
+            # the embedded web server can be slow to answer, but should accept connections quickly
+            timeout=httpx.Timeout(10.0, connect=5.0),
+        )
+    return _shared_client
+
+
+async def async_close_shared_client() -> None:
+    """Close the shared HTTP client and release its connections."""
+    global _shared_client
+    if _shared_client is None:
+        return
+    client, _shared_client = _shared_client, None
+    await client.aclose()
+
+
+def _status_error(resp: httpx.Response) -> httpx.HTTPStatusError:
+    """Build the `httpx.HTTPStatusError` for a non-2xx response.
+
+    A plain message instead of the one from `Response.raise_for_status`, which
+    also includes the redirect location and a docs link.
+    """
+    return httpx.HTTPStatusError(
+        f"HTTP {resp.status_code}", request=resp.request, response=resp
+    )
+
+
+def _check_status(resp: httpx.Response) -> None:
+    """Raise `httpx.HTTPStatusError` for non-2xx responses.
+
+    The response body is only decoded if the error ends up being logged.
+    """
+    if not resp.is_success:
+        raise _status_error(resp)
+
+
+def _parse_json(content: bytes, debug: bool) -> Any:
+    """Parse a JSON response body, repairing it if it's malformed.
+
+    Empty bodies are treated as `None`. Runs in an executor thread for large
+    payloads so it must not touch the event loop.
+    """
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        if not content:
+            # we got an empty response, we just treat this as 'None'
+            return None
+        if debug:
+            _LOGGER.debug("invalid json payload: %s", content)
+        # Try to repair the JSON response before giving up
+        try:
+            # only needed for malformed payloads, so import lazily
+            import json_repair
+
+            data = json_repair.repair_json(
+                content.decode(errors="replace"),
+                skip_json_loads=True,
+                return_objects=True,
+            )
+        except Exception as repair_error:
+            if debug:
+                _LOGGER.debug("json repair failed: %s", repair_error)
+            raise  # Re-raise the original ValueError
+        if debug:
+            _LOGGER.debug("successfully repaired json: %s", data)
+        return data
+
+
+async def _parse_response(
+    resp: httpx.Response,
+    *,
+    raw: bool,
+    expected_type: Any,
+    reject_empty: bool,
+    debug: bool,
+) -> Any:
+    """Parse and validate a successful response, see `VZugApi._command`.
+
+    Raises:
+        AssertionError: If the data doesn't have the expected type or is empty
+            while `reject_empty` is set.
+    """
+    if raw:
+        content = resp.text
+        if debug:
+            _LOGGER.debug("raw response: %s", content)
+        return content
+
+    content = resp.content
+    if len(content) > _INLINE_PARSE_LIMIT:
+        # big payloads (config trees, program lists) are parsed in a worker thread
+        data = await asyncio.get_running_loop().run_in_executor(
+            None, _parse_json, content, debug
+        )
+    else:
+        data = _parse_json(content, debug)
+
+    if debug:
+        _LOGGER.debug("data: %s", data)
+    if expected_type is list and data is None:
+        # if we want a list and the response is null, we just treat that as an empty list
+        data: Any = _EMPTY_LIST
+    elif expected_type is not None:
+        assert isinstance(data, expected_type), (
+            f"data type mismatch ({type(data)} != {expected_type})"
+        )
+    if reject_empty:
+        assert len(data) > 0, "empty response rejected"
+    return data
+
+
+def _is_cancelling() -> bool:
+    """Return whether cancellation of the current task was requested."""
+    task = asyncio.current_task()
+    return task is not None and task.cancelling() > 0
+
+
+def _empty_list() -> Sequence[Any]:
+    return _EMPTY_LIST
+
+
+def _default_zh_mode() -> dict[str, int]:
+    return {"value": -1}
+
+
 class VZugApi:
     """API client for interacting with V-ZUG appliances.
 
@@ -263,20 +461,77 @@ class VZugApi:
         *,
         credentials: Credentials | None = None,
     ) -> None:
-        auth = (
+        # digest auth is stateful and the credentials differ per device, so it's
+        # passed with every request instead of being set on the shared client
+        self._auth = (
             httpx.DigestAuth(
                 username=credentials.username, password=credentials.password
             )
             if credentials
             else None
         )
-        transport = httpx.AsyncHTTPTransport(
-            verify=False,
-            limits=httpx.Limits(max_connections=3, max_keepalive_connections=1),
-            retries=5,
-        )
-        self._client = httpx.AsyncClient(auth=auth, transport=transport)
         self._base_url = URL(base_url)
+        self._component_urls: dict[str, str] = {}
+        # requests currently in flight, used to coalesce identical concurrent GETs
+        self._inflight: dict[tuple[Any, ...], asyncio.Future[httpx.Response]] = {}
+        # incremented after every write, so reads sent before it aren't shared with later ones
+        self._generation = 0
+        # responses of optional commands the device doesn't support, so they aren't
+        # requested again. Cleared when a firmware update is started.
+        self._unsupported: dict[tuple[str, str], httpx.Response] = {}
+
+    @property
+    def generation(self) -> int:
+        """Return the number of writes sent to the device so far."""
+        return self._generation
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        # looked up on every use so a client closed on unload is transparently replaced
+        return get_shared_client()
+
+    def _component_url(self, component: str) -> str:
+        """Return the URL of an API component, building it only on first use."""
+        try:
+            return self._component_urls[component]
+        except KeyError:
+            url = self._component_urls[component] = str(self._base_url / component)
+            return url
+
+    async def _get(self, url: str, params: dict[str, str]) -> httpx.Response:
+        """Perform a GET request, sharing the response with identical concurrent requests.
+
+        If a request for the same URL and parameters is already in flight, the
+        caller awaits that request instead of sending another one to the device.
+        Requests are only shared if no write was sent in between, so a read
+        after a write never returns the state from before it.
+        """
+        key = (url, tuple(sorted(params.items())), self._generation)
+        while (pending := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled() or _is_cancelling():
+                    raise
+                # the caller that sent the request was cancelled, but we weren't
+
+        fut: asyncio.Future[httpx.Response] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = fut
+        try:
+            resp = await self._client.get(url, params=params, auth=self._auth)
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as exc:
+            fut.set_exception(exc)
+            # mark the exception as retrieved in case nobody else is waiting
+            fut.exception()
+            raise
+        else:
+            fut.set_result(resp)
+            return resp
+        finally:
+            del self._inflight[key]
 
     async def _command(
         self,
@@ -288,7 +543,7 @@ class VZugApi:
         expected_type: Any = None,
         reject_empty: bool = False,
         attempts: int = 5,
-        retry_delay: float = 2.0,
+        retry_delay: float = 1.0,
         value_on_err: Callable[[], Any] | None = None,
     ) -> Any:
         """Execute a command on the V-ZUG device API.
@@ -305,9 +560,13 @@ class VZugApi:
                          AssertionError if type doesn't match.
             reject_empty: If True, raise AssertionError on empty responses.
             attempts: Number of retry attempts for failed requests.
-            retry_delay: Delay in seconds between retries.
+            retry_delay: Base delay in seconds before the first retry. The
+                         delay doubles with every further retry (capped and
+                         with random jitter applied).
             value_on_err: Optional callback function that returns a default
-                         value if all retries fail.
+                         value if all retries fail. Getters pass plain
+                         constructors (ex. `list` or a TypedDict) so no
+                         closure is allocated per call.
 
         Returns:
             Parsed response data (dict/list/string) or value from value_on_err
@@ -315,145 +574,89 @@ class VZugApi:
 
         Raises:
             AuthenticationFailed: If authentication fails (HTTP 401).
-            httpx.HTTPStatusError: For non-retryable HTTP errors.
+            httpx.HTTPStatusError: For client errors (4xx), which are never
+                                  retried and bypass value_on_err. Optional
+                                  commands the device doesn't support
+                                  (404/405/501) fail the same way and are
+                                  remembered, so they fail without a request
+                                  afterwards.
             httpx.TransportError: For network errors after all retries.
             AssertionError: If response type validation fails.
             ValueError: If JSON parsing fails and repair is unsuccessful.
         """
-        if params is None:
-            params = {}
-        final_params = params.copy()
-        final_params["command"] = command
-        final_params["_"] = str(int(time.time()))
+        final_params = {**params, "command": command} if params else {"command": command}
 
-        url = str(self._base_url / component)
+        url = self._component_url(component)
+        # checked once so disabled debug logging doesn't build any log arguments
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
-        async def once() -> Any:
-            _LOGGER.debug(
-                "running command %s %s on %s @ %s",
-                command,
-                params,
-                component,
-                self._base_url,
-            )
-            resp = await self._client.get(url, params=final_params)
-            resp.raise_for_status()
-
-            if raw:
-                content = resp.text
-                _LOGGER.debug("raw response: %s", content)
-                return content
+        if (unsupported_resp := self._unsupported.get((component, command))) is not None:
+            raise _status_error(unsupported_resp)
 
-            try:
-                data = resp.json()
-            except ValueError:
-                if resp.content:
-                    _LOGGER.debug("invalid json payload: %s", resp.content)
-                    # Try to repair the JSON response before giving up
-                    try:
-                        repaired_json = json_repair.repair_json(resp.text)
-                        data = json.loads(repaired_json)
-                        _LOGGER.debug("successfully repaired json: %s", data)
-                    except Exception as repair_error:
-                        _LOGGER.debug("json repair failed: %s", repair_error)
-                        raise  # Re-raise the original ValueError
-                else:
-                    # we got an empty response, we just treat this as 'None'
-                    data = None
-
-            _LOGGER.debug("data: %s", data)
-            if expected_type is list and data is None:
-                # if we want a list and the response is null, we just treat that as an empty list
-                data: Any = []
-
-            if expected_type is not None:
-                assert isinstance(data, expected_type), (
-                    f"data type mismatch ({type(data)} != {expected_type})"
-                )
-            if reject_empty:
-                assert len(data) > 0, "empty response rejected"
-            return data
-
-        last_exc = ValueError("no attempts made")
+        last_exc: Exception | None = None
+        # response of the last server error, only turned into an exception if it's raised
+        last_error_resp: httpx.Response | None = None
         attempt_idx = 0
         while attempt_idx < attempts:
-            # starts with 0s, then retry_delay
-            await asyncio.sleep(attempt_idx * retry_delay)
-
-            try:
-                return await once()
-            except httpx.HTTPStatusError as err:
-                if err.response.status_code == httpx.codes.UNAUTHORIZED:
-                    _LOGGER.warning(
-                        "Authentication failed for command %s on %s @ %s (attempt %d/%d)",
-                        command,
-                        component,
-                        self._base_url,
-                        attempt_idx + 1,
-                        attempts,
-                    )
-                    raise AuthenticationFailed from err
-                if not err.response.is_server_error:
-                    _LOGGER.warning(
-                        "HTTP error %d for command %s on %s @ %s (attempt %d/%d): %s",
-                        err.response.status_code,
-                        command,
-                        component,
-                        self._base_url,
-                        attempt_idx + 1,
-                        attempts,
-                        err.response.text[:200] if err.response.text else "No response body",
-                    )
-                    raise
+            if attempt_idx:
+                # exponential backoff with jitter so parallel requests don't retry in lockstep
+                delay = min(_RETRY_MAX_DELAY, retry_delay * 2 ** (attempt_idx - 1))
+                await asyncio.sleep(
+                    delay * (1 + random.uniform(-_RETRY_JITTER, _RETRY_JITTER))
+                )
 
-                last_exc = err
+            if debug:
                 _LOGGER.debug(
-                    "Server error %d for command %s on %s @ %s (attempt %d/%d): %s",
-                    err.response.status_code,
+                    "running command %s %s on %s @ %s",
                     command,
+                    params,
                     component,
                     self._base_url,
-                    attempt_idx + 1,
-                    attempts,
-                    err.response.text[:200] if err.response.text else "No response body",
                 )
+            try:
+                resp = await self._get(url, final_params)
+                if resp.is_success:
+                    return await _parse_response(
+                        resp,
+                        raw=raw,
+                        expected_type=expected_type,
+                        reject_empty=reject_empty,
+                        debug=debug,
+                    )
             except httpx.TransportError as err:
-                last_exc = err
-                _LOGGER.debug(
-                    "Transport error for command %s on %s @ %s (attempt %d/%d): %r",
-                    command,
-                    component,
-                    self._base_url,
-                    attempt_idx + 1,
-                    attempts,
-                    err,
+                last_exc, last_error_resp = err, None
+                self._log_attempt_failed(
+                    "Transport error", err, component, command, attempt_idx, attempts
                 )
-                continue
             except AssertionError as exc:
-                last_exc = exc
-                _LOGGER.debug(
-                    "Response data assertion failed for command %s on %s @ %s (attempt %d/%d): %s",
-                    command,
+                last_exc, last_error_resp = exc, None
+                self._log_attempt_failed(
+                    "Response data assertion failed",
+                    exc,
                     component,
-                    self._base_url,
-                    attempt_idx + 1,
+                    command,
+                    attempt_idx,
                     attempts,
-                    exc,
                 )
             except Exception as exc:
-                last_exc = exc
-                _LOGGER.debug(
-                    "Unknown error for command %s on %s @ %s (attempt %d/%d): %r",
-                    command,
-                    component,
-                    self._base_url,
-                    attempt_idx + 1,
-                    attempts,
-                    exc,
+                last_exc, last_error_resp = exc, None
+                self._log_attempt_failed(
+                    "Unknown error", exc, component, command, attempt_idx, attempts
                 )
+            else:
+                # non-2xx response, no exception is built for server errors that are retried anyway
+                self._check_error_status(
+                    resp, component, command, attempt_idx, attempts
+                )
+                last_exc, last_error_resp = None, resp
 
             attempt_idx += 1
 
+        if last_error_resp is not None:
+            last_exc = _status_error(last_error_resp)
+        elif last_exc is None:
+            last_exc = ValueError("no attempts made")
+
         if value_on_err:
             _LOGGER.exception(
                 "Command error after %d attempts, using default: %s %s on %s @ %s",
@@ -468,6 +671,163 @@ class VZugApi:
 
         raise last_exc
 
+    def _check_error_status(
+        self,
+        resp: httpx.Response,
+        component: str,
+        command: str,
+        attempt_idx: int,
+        attempts: int,
+    ) -> None:
+        """Raise for non-retryable status codes of `_command`, only server errors are retried.
+
+        Classified by status code so that an `httpx.HTTPStatusError` is only
+        built once the error is actually raised.
+        """
+        status_code = resp.status_code
+        if status_code == httpx.codes.UNAUTHORIZED:
+            _LOGGER.warning(
+                "Authentication failed for command %s on %s @ %s (attempt %d/%d)",
+                command,
+                component,
+                self._base_url,
+                attempt_idx + 1,
+                attempts,
+            )
+            raise AuthenticationFailed from _status_error(resp)
+        optional = (component, command) in _OPTIONAL_COMMANDS
+        if status_code in _UNSUPPORTED_STATUS_CODES and (
+            optional or status_code != httpx.codes.NOT_IMPLEMENTED
+        ):
+            # the device doesn't support this command, retrying won't change that.
+            # Callers (ex. 'aggregate_meta') rely on getting the error even with 'value_on_err'.
+            # A 501 for any other command is treated like the server error it is.
+            if optional:
+                self._unsupported[component, command] = resp
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Command %s on %s @ %s not supported (HTTP %d)",
+                    command,
+                    component,
+                    self._base_url,
+                    status_code,
+                )
+            raise _status_error(resp)
+        if not resp.is_server_error:
+            # any other client error is permanent as well
+            _LOGGER.warning(
+                "HTTP error %d for command %s on %s @ %s (attempt %d/%d): %s",
+                status_code,
+                command,
+                component,
+                self._base_url,
+                attempt_idx + 1,
+                attempts,
+                resp.text[:200] if resp.text else "No response body",
+            )
+            raise _status_error(resp)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Server error %d for command %s on %s @ %s (attempt %d/%d): %s",
+                status_code,
+                command,
+                component,
+                self._base_url,
+                attempt_idx + 1,
+                attempts,
+                resp.text[:200] if resp.text else "No response body",
+            )
+
+    def _log_attempt_failed(
+        self,
+        reason: str,
+        exc: Exception,
+        component: str,
+        command: str,
+        attempt_idx: int,
+        attempts: int,
+    ) -> None:
+        """Log a failed attempt of `_command`."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s for command %s on %s @ %s (attempt %d/%d): %r",
+                reason,
+                command,
+                component,
+                self._base_url,
+                attempt_idx + 1,
+                attempts,
+                exc,
+            )
+
+    async def _command_noreturn(
+        self,
+        component: str,
+        *,
+        command: str,
+        params: dict[str, str] | None = None,
+    ) -> None:
+        """Execute a command whose response body isn't needed.
+
+        This is a lightweight alternative to `_command` for setters and actions.
+        The response is not parsed and the request is retried only once, and
+        only on transport errors, so user-triggered actions stay responsive.
+
+        Args:
+            component: API component to call (e.g., "ai" or "hh").
+            command: Command name to execute.
+            params: Optional query parameters for the command.
+
+        Raises:
+            AuthenticationFailed: If authentication fails (HTTP 401).
+            httpx.HTTPStatusError: If the device responds with an error status.
+            httpx.TransportError: If the request fails on both attempts.
+        """
+        final_params = {**params, "command": command} if params else {"command": command}
+        url = self._component_url(component)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+        if debug:
+            _LOGGER.debug(
+                "running command %s %s on %s @ %s",
+                command,
+                params,
+                component,
+                self._base_url,
+            )
+        try:
+            try:
+                resp = await self._client.get(
+                    url, params=final_params, auth=self._auth
+                )
+            except httpx.TransportError as err:
+                if debug:
+                    _LOGGER.debug(
+                        "Transport error for command %s on %s @ %s, retrying once: %r",
+                        command,
+                        component,
+                        self._base_url,
+                        err,
+                    )
+                resp = await self._client.get(
+                    url, params=final_params, auth=self._auth
+                )
+        finally:
+            # reads in flight may have been answered before the write, don't share
+            # them with later reads. Even a failed write may have reached the device.
+            self._generation += 1
+
+        if resp.status_code == httpx.codes.UNAUTHORIZED:
+            _LOGGER.warning(
+                "Authentication failed for command %s on %s @ %s",
+                command,
+                component,
+                self._base_url,
+            )
+            raise AuthenticationFailed
+        _check_status(resp)
+
     async def aggregate_state(self, *, default_on_error: bool = True) -> AggState:
         """Aggregate device state from multiple API endpoints.
 
@@ -543,7 +903,7 @@ class VZugApi:
 
         This is typically called during device discovery and setup to gather
         device identification information. Fetches MAC address, device status,
-        model description, and firmware versions.
+        model description, firmware versions and device info in parallel.
 
         Args:
             default_on_error: If True, returns empty/default values for failed
@@ -558,53 +918,50 @@ class VZugApi:
             httpx.HTTPStatusError: If critical endpoints fail when
                                   default_on_error is False.
         """
+        async def _device_info() -> DeviceInfo | None:
+            try:
+                # Only supported on some devices, probably with newer hh module
+                return await self.get_device_info(default_on_error=True)
+            except httpx.HTTPStatusError as exc:
+                if exc.response.status_code in _UNSUPPORTED_STATUS_CODES:
+                    # Device does not support this, so we just use the AI data
+                    return None
+                raise
+
         # First method used in config flow to get details about the device
         (
             mac_address,
             device_status,
             model_description,
             ai_firmware,
+            device_info,
         ) = await asyncio.gather(
             # This is all from the AI Module/API
             self.get_mac_address(default_on_error=default_on_error),
             self.get_device_status(default_on_error=default_on_error),
             self.get_model_description(default_on_error=default_on_error),
             self.get_ai_fw_version(default_on_error=default_on_error),
+            # and this from the HH module
+            _device_info(),
         )
 
-        try:
-            # Only supported on some devices, probably with newer hh module
-            device_info = await self.get_device_info(default_on_error=True)
-        except httpx.HTTPStatusError as exc:
-            if exc.response.status_code == httpx.codes.NOT_FOUND:
-                # Device does not support this, so we just use the AI data
-                device_info = None
-            else:
-                raise
-
         if device_info:
-            raw_api_version = device_info.get("apiVersion", "")
-            hh_api_version = tuple(map(int, (raw_api_version.split("."))))
-
             return AggMeta(
                 mac_address=mac_address,
                 model_id=device_info.get("model", ""),
                 model_name=device_info.get("description", ""),
                 device_name=device_info.get("name", ""),
                 serial_number=device_info.get("serialNumber", ""),
-                api_version=hh_api_version,
+                api_version=_parse_api_version(device_info.get("apiVersion", "")),
             )
         else:
-            raw_api_version = ai_firmware.get("apiVersion", "")
-            ai_api_version = tuple(map(int, (raw_api_version.split("."))))
-
             return AggMeta(
                 mac_address=mac_address,
                 model_id="",
                 model_name=model_description,
                 device_name=device_status.get("DeviceName", ""),
                 serial_number=device_status.get("Serial", ""),
-                api_version=ai_api_version,
+                api_version=_parse_api_version(ai_firmware.get("apiVersion", "")),
             )
 
     async def aggregate_config(self) -> AggConfig:
@@ -623,26 +980,37 @@ class VZugApi:
             httpx.HTTPStatusError: If configuration endpoints are unavailable.
         """
         category_keys = await self.list_categories()
-        config_tree: AggConfig = {}
-        for category_key in category_keys:
-            category_raw, command_keys = await asyncio.gather(
-                self.get_category(category_key),
-                self.list_commands(category_key),
-            )
-            category = AggCategory(
+        semaphore = asyncio.Semaphore(_CONFIG_FETCH_CONCURRENCY)
+
+        async def bounded[T](coro: Awaitable[T]) -> T:
+            async with semaphore:
+                return await coro
+
+        categories_raw, command_lists = await asyncio.gather(
+            asyncio.gather(*(bounded(self.get_category(key)) for key in category_keys)),
+            asyncio.gather(*(bounded(self.list_commands(key)) for key in category_keys)),
+        )
+
+        # flatten the tree so all commands are fetched in a single fan-out
+        plan = [
+            (category_key, command_key)
+            for category_key, command_keys in zip(category_keys, command_lists)
+            for command_key in command_keys
+        ]
+        commands_raw = await asyncio.gather(
+            *(bounded(self.get_command(command_key)) for _, command_key in plan)
+        )
+
+        config_tree: AggConfig = {
+            category_key: AggCategory(
                 key=category_key,
                 description=category_raw.get("description", ""),
                 commands={},
             )
-
-            async def handle_command_key(command_key: str) -> None:
-                command_raw = await self.get_command(command_key)
-                category.commands[command_key] = command_raw
-
-            await asyncio.gather(
-                *(handle_command_key(command_key) for command_key in command_keys)
-            )
-            config_tree[category_key] = category
+            for category_key, category_raw in zip(category_keys, categories_raw)
+        }
+        for (category_key, command_key), command_raw in zip(plan, commands_raw):
+            config_tree[category_key].commands[command_key] = command_raw
         return config_tree
 
     async def get_mac_address(self, *, default_on_error: bool = False) -> str:
@@ -658,7 +1026,7 @@ class VZugApi:
             "ai",
             command="getMacAddress",
             raw=True,
-            value_on_err=(lambda: "") if default_on_error else None,
+            value_on_err=str if default_on_error else None,
         )
 
     async def get_model_description(self, *, default_on_error: bool = False) -> str:
@@ -666,7 +1034,7 @@ class VZugApi:
             "ai",
             command="getModelDescription",
             raw=True,
-            value_on_err=(lambda: "") if default_on_error else None,
+            value_on_err=str if default_on_error else None,
         )
 
     async def get_device_status(
@@ -676,7 +1044,7 @@ class VZugApi:
             "ai",
             command="getDeviceStatus",
             expected_type=dict,
-            value_on_err=(lambda: DeviceStatus()) if default_on_error else None,
+            value_on_err=DeviceStatus if default_on_error else None,
         )
 
     async def get_update_status(
@@ -686,34 +1054,32 @@ class VZugApi:
             "ai",
             command="getUpdateStatus",
             expected_type=dict,
-            value_on_err=(lambda: UpdateStatus()) if default_on_error else None,
+            value_on_err=UpdateStatus if default_on_error else None,
         )
 
     async def check_for_updates(self) -> None:
-        await self._command(
-            "ai",
-            command="checkUpdate",
-            raw=True,
-            attempts=2,
-        )
+        await self._command_noreturn("ai", command="checkUpdate")
 
     async def do_ai_update(self) -> None:
-        await self._command("ai", command="doAIUpdate")
+        await self._command_noreturn("ai", command="doAIUpdate")
+        # the new firmware may support more commands
+        self._unsupported.clear()
 
     async def do_hhg_update(self) -> None:
-        await self._command("ai", command="doHHGUpdate")
+        await self._command_noreturn("ai", command="doHHGUpdate")
+        self._unsupported.clear()
 
     async def get_last_push_notifications(
         self, *, default_on_error: bool = False
-    ) -> list[PushNotification]:
+    ) -> Sequence[PushNotification]:
         return await self._command(
             "ai",
             command="getLastPUSHNotifications",
             expected_type=list,
-            value_on_err=(lambda: []) if default_on_error else None,
+            value_on_err=_empty_list if default_on_error else None,
         )
 
-    async def list_categories(self) -> list[str]:
+    async def list_categories(self) -> Sequence[str]:
         return await self._command(
             "hh",
             command="getCategories",
@@ -727,39 +1093,31 @@ class VZugApi:
             "hh", command="getCategory", params={"value": value}, expected_type=dict
         )
 
-    async def list_commands(self, value: str) -> list[str]:
+    async def list_commands(self, value: str) -> Sequence[str]:
         return await self._command(
             "hh", command="getCommands", params={"value": value}, expected_type=list
         )
 
     async def get_command(self, value: str) -> Command:
-        return await self._command(
+        data = await self._command(
             "hh", command="getCommand", params={"value": value}, expected_type=dict
         )
+        return Command.build(data)
 
     async def set_command(self, command: str, value: str) -> None:
-        await self._command(
-            "hh",
-            command=f"set{command}",
-            params={"value": value},
-            raw=True,
-            attempts=2,
+        await self._command_noreturn(
+            "hh", command=f"set{command}", params={"value": value}
         )
 
     async def do_command_action(self, command: str) -> None:
-        await self._command(
-            "hh",
-            command=f"do{command}",
-            raw=True,
-            attempts=2,
-        )
+        await self._command_noreturn("hh", command=f"do{command}")
 
     async def get_hh_fw_version(self, *, default_on_error: bool = False) -> HhFwVersion:
         return await self._command(
             "hh",
             command="getFWVersion",
             expected_type=dict,
-            value_on_err=(lambda: HhFwVersion()) if default_on_error else None,
+            value_on_err=HhFwVersion if default_on_error else None,
         )
 
     async def get_ai_fw_version(self, *, default_on_error: bool = False) -> AiFwVersion:
@@ -767,7 +1125,7 @@ class VZugApi:
             "ai",
             command="getFWVersion",
             expected_type=dict,
-            value_on_err=(lambda: AiFwVersion()) if default_on_error else None,
+            value_on_err=AiFwVersion if default_on_error else None,
         )
 
     async def get_zh_mode(self, *, default_on_error: bool = False) -> int:
@@ -775,7 +1133,7 @@ class VZugApi:
             "hh",
             command="getZHMode",
             expected_type=dict,
-            value_on_err=(lambda: {"value": -1}) if default_on_error else None,
+            value_on_err=_default_zh_mode if default_on_error else None,
         )
         return data["value"]
 
@@ -797,7 +1155,7 @@ class VZugApi:
             "hh",
             command="getEcoInfo",
             expected_type=dict,
-            value_on_err=(lambda: EcoInfo()) if default_on_error else None,
+            value_on_err=EcoInfo if default_on_error else None,
         )
 
         water_total = result.get("water", {}).get("total", 0)
@@ -817,7 +1175,7 @@ class VZugApi:
             "hh",
             command="getDeviceInfo",
             expected_type=dict,
-            value_on_err=(lambda: DeviceInfo()) if default_on_error else None,
+            value_on_err=DeviceInfo if default_on_error else None,
         )
 
     async def get_program(self) -> list[Program]:
@@ -839,7 +1197,7 @@ class VZugApi:
         # TODO: this is interesting but what can we do with it??
         # [{"id":52,"name":"Alltag Kurz","status":"selected","starttime":{"min":0,"max":86400,"step":600},"duration":{"set":2460}, "energySaving":{"set":false,"options":[true,false]},"optiStart":{"set":false},"steamfinish":{"set":false,"options":[true,false]},"partialload":{"set":false,"options":[true,false]},"rinsePlus":{"set":false,"options":[true,false]},"dryPlus":{"set":false,"options":[true,false]},"stepIds":[82,81,82,79,78,76,73,74,75,72,71,70]}]
         # [{"id":50,"name":"Eco",        "status":"selected","starttime":{"min":0,"max":86400,"step":600},"duration":{"set":22440},"energySaving":{"set":false,"options":[true,false]},"optiStart":{"set":false},"steamfinish":{"set":true, "options":[true,false]},"partialload":{"set":false,"options":[true,false]},"rinsePlus":{"set":false,"options":[true,false]},"dryPlus":{"set":false,"options":[true,false]},"stepIds":[79,81,79,78,74,75,72,70]}]
-        raw_programs: list[dict[str, Any]] = await self._command(
+        raw_programs: Sequence[dict[str, Any]] = await self._command(
             "hh",
             command="getProgram",
             expected_type=list,
@@ -876,15 +1234,19 @@ class VZugApi:
         if not options:
             options = {}
         options["id"] = program_id
-        return await self._command(
-            "hh",
-            command="setProgram",
-            params={"value": json.dumps(options)},
-            raw=True,
-            attempts=2,
-        )
+        try:
+            return await self._command(
+                "hh",
+                command="setProgram",
+                params={"value": orjson.dumps(options).decode()},
+                raw=True,
+                attempts=2,
+            )
+        finally:
+            # see '_command_noreturn', this is a write as well
+            self._generation += 1
 
-    async def get_all_program_ids(self) -> list[int]:
+    async def get_all_program_ids(self) -> Sequence[int]:
         """Get list of all available program IDs.
 
         Returns all program IDs that can be used with setProgram. Note that
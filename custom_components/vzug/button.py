@@ -22,12 +22,12 @@ async def async_setup_entry(
 
     for category in shared.config_coord.data.values():
         for command in category.commands.values():
-            if command.get("type") == "action":
+            if command.type == "action":
                 entities.append(
                     UserConfig(
                         shared,
                         category_key=category.key,
-                        command_key=command.get("command", ""),
+                        command_key=command.command,
                     )
                 )
 
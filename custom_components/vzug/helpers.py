@@ -1,17 +1,34 @@
+import functools
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
 from homeassistant.const import EntityCategory
-from homeassistant.helpers.typing import UndefinedType
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import api
 from .shared import ConfigCoordinator, Shared
 
 
+@functools.cache
+def _user_config_attributes(category_key: str, command_key: str) -> Mapping[str, Any]:
+    """Return the (read-only) state attributes of a user config entity.
+
+    Devices of the same model share their configuration schema, so entities
+    for the same command share a single instance.
+    """
+    return MappingProxyType({"category_key": category_key, "command_key": command_key})
+
+
 class UserConfigEntity(CoordinatorEntity[ConfigCoordinator]):
     """Base class for entities representing user-configurable device settings.
 
     These entities are dynamically created based on the device's configuration
     tree. The entity category (CONFIG vs DIAGNOSTIC) is determined by whether
-    the command is alterable.
+    the command is alterable. Name and category are refreshed on every
+    coordinator update.
 
     Attributes:
         shared: Shared coordinator and state for the device.
@@ -32,17 +49,19 @@ class UserConfigEntity(CoordinatorEntity[ConfigCoordinator]):
         """
         super().__init__(shared.config_coord)
         self.shared = shared
-        self.vzug_category_key = category_key
-        self.vzug_command_key = command_key
+        # the keys come from a small, fixed vocabulary and are used for every lookup
+        # in the configuration tree, interning them makes the key comparisons cheap
+        self.vzug_category_key = sys.intern(category_key)
+        self.vzug_command_key = sys.intern(command_key)
 
-        self._attr_unique_id = (
+        self._attr_unique_id = sys.intern(
             f"{shared.unique_id_prefix}-userconfig-{category_key}-{command_key}"
         )
         self._attr_device_info = shared.device_info
-        self._attr_extra_state_attributes = {
-            "category_key": category_key,
-            "command_key": command_key,
-        }
+        self._extra_attributes = _user_config_attributes(
+            self.vzug_category_key, self.vzug_command_key
+        )
+        self._update_from_vzug_command()
 
     @property
     def available(self) -> bool:
@@ -52,26 +71,34 @@ class UserConfigEntity(CoordinatorEntity[ConfigCoordinator]):
             and self.coordinator.data is not None
         )
 
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        return self._extra_attributes
+
     @property
     def vzug_command(self) -> api.Command:
+        """Return the command data, resolved once per coordinator update."""
+        return self._vzug_command
+
+    def _lookup_vzug_command(self) -> api.Command:
+        data = self.coordinator.data
+        if data is None:
+            return api.Command()
         try:
-            return self.coordinator.data[self.vzug_category_key].commands[
-                self.vzug_command_key
-            ]
+            return data[self.vzug_category_key].commands[self.vzug_command_key]
         except LookupError:
             return api.Command()
 
-    @property
-    def name(self) -> str | UndefinedType | None:
-        name = self.vzug_command.get("description")
-        if not name:
-            name = self.vzug_command_key
-        return name
-
-    @property
-    def entity_category(self) -> EntityCategory | None:
-        return (
+    def _update_from_vzug_command(self) -> None:
+        command = self._vzug_command = self._lookup_vzug_command()
+        self._attr_name = command.description or self.vzug_command_key
+        self._attr_entity_category = (
             EntityCategory.CONFIG
-            if self.vzug_command.get("alterable", False)
+            if command.alterable
             else EntityCategory.DIAGNOSTIC
         )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._update_from_vzug_command()
+        super()._handle_coordinator_update()
@@ -19,12 +19,12 @@ async def async_setup_entry(
 
     for category in shared.config_coord.data.values():
         for command in category.commands.values():
-            if command.get("type") == "range" and command.get("alterable", True):
+            if command.type == "range" and command.alterable is not False:
                 entities.append(
                     UserConfig(
                         shared,
                         category_key=category.key,
-                        command_key=command.get("command", ""),
+                        command_key=command.command,
                     )
                 )
 
@@ -37,14 +37,14 @@ class UserConfig(NumberEntity, UserConfigEntity):
     @property
     def native_min_value(self) -> float:
         try:
-            return float(self.vzug_command["minMax"][0])
+            return float(self.vzug_command.minMax[0])
         except (ValueError, LookupError, TypeError):
             return 0.0
 
     @property
     def native_max_value(self) -> float:
         try:
-            return float(self.vzug_command["minMax"][1])
+            return float(self.vzug_command.minMax[1])
         except (ValueError, LookupError, TypeError):
             return 0.0
 
@@ -54,7 +54,7 @@ class UserConfig(NumberEntity, UserConfigEntity):
 
     @property
     def native_value(self) -> float | None:
-        value = self.vzug_command.get("value")
+        value = self.vzug_command.value
         if not value:
             return None
         try:
@@ -19,12 +19,12 @@ async def async_setup_entry(
 
     for category in shared.config_coord.data.values():
         for command in category.commands.values():
-            if command.get("type") == "selection" and command.get("alterable", True):
+            if command.type == "selection" and command.alterable is not False:
                 entities.append(
                     UserConfig(
                         shared,
                         category_key=category.key,
-                        command_key=command.get("command", ""),
+                        command_key=command.command,
                     )
                 )
 
@@ -34,11 +34,11 @@ async def async_setup_entry(
 class UserConfig(SelectEntity, UserConfigEntity):
     @property
     def current_option(self) -> str | None:
-        return self.vzug_command.get("value")
+        return self.vzug_command.value
 
     @property
     def options(self) -> list[str]:
-        return self.vzug_command.get("options", [])
+        return self.vzug_command.options
 
     async def async_select_option(self, option: str) -> None:
         await self.shared.client.set_command(self.vzug_command_key, option)
@@ -103,12 +103,12 @@ async def async_setup_entry(
 
     for category in shared.config_coord.data.values():
         for command in category.commands.values():
-            if command.get("type") == "status":
+            if command.type == "status":
                 entities.append(
                     UserConfigSensor(
                         shared,
                         category_key=category.key,
-                        command_key=command.get("command", ""),
+                        command_key=command.command,
                     )
                 )
 
@@ -310,4 +310,4 @@ class UserConfigSensor(SensorEntity, UserConfigEntity):
 
     @property
     def native_value(self) -> StateType | date | datetime | Decimal:
-        return self.vzug_command.get("value")
+        return self.vzug_command.value
@@ -1,6 +1,9 @@
+import asyncio
 import contextlib
 import logging
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
+from types import TracebackType
 
 import yarl
 from homeassistant.core import HomeAssistant
@@ -20,6 +23,10 @@ UPDATE_COORD_IDLE_INTERVAL = timedelta(hours=6)
 UPDATE_COORD_ACTIVE_INTERVAL = timedelta(seconds=5)
 
 ConfigCoordinator = DataUpdateCoordinator[api.AggConfig]
+CONFIG_COORD_DEFAULT_INTERVAL = timedelta(minutes=5)
+CONFIG_COORD_MAX_INTERVAL = timedelta(minutes=30)
+# number of unchanged polls after which the config interval is stretched by another step
+CONFIG_COORD_BACKOFF_POLLS = 3
 
 
 class Shared:
@@ -34,7 +41,9 @@ class Shared:
         client: VZugApi client for communicating with the device.
         state_coord: Coordinator for device state updates (30s interval).
         update_coord: Coordinator for firmware update status (adaptive interval).
-        config_coord: Coordinator for device configuration (5min interval).
+        config_coord: Coordinator for device configuration (adaptive interval,
+            backs off from config_interval while the config doesn't change).
+        config_interval: Base interval of the config coordinator.
         unique_id_prefix: MAC address used as prefix for entity unique IDs.
         meta: Aggregated device metadata.
         device_info: Home Assistant DeviceInfo for device registry.
@@ -46,6 +55,7 @@ class Shared:
     state_coord: StateCoordinator
     update_coord: UpdateCoordinator
     config_coord: ConfigCoordinator
+    config_interval: timedelta
 
     unique_id_prefix: str
     meta: api.AggMeta
@@ -75,23 +85,36 @@ class Shared:
             _LOGGER,
             name="state",
             update_interval=timedelta(seconds=30),
-            update_method=self._fetch_state,
+            update_method=single_flight(
+                self._fetch_state, generation=self._client_generation
+            ),
         )
         self.update_coord = DataUpdateCoordinator(
             hass,
             _LOGGER,
             name="update",
             update_interval=UPDATE_COORD_IDLE_INTERVAL,
-            update_method=self._fetch_update,
+            update_method=single_flight(
+                self._fetch_update, generation=self._client_generation
+            ),
+            always_update=False,
         )
         self.config_coord = DataUpdateCoordinator(
             hass,
             _LOGGER,
             name="config",
-            update_interval=timedelta(minutes=5),
-            update_method=self._fetch_config,
+            update_interval=CONFIG_COORD_DEFAULT_INTERVAL,
+            update_method=single_flight(
+                self._fetch_config, generation=self._client_generation
+            ),
+            # the config rarely changes, don't write the state of every config
+            # entity when it didn't. The aggregates compare by value.
+            always_update=False,
         )
 
+        self.config_interval = CONFIG_COORD_DEFAULT_INTERVAL
+        self._config_unchanged_polls = 0
+
         # the rest will be set on first refresh
         self.unique_id_prefix = ""
         self.device_info = DeviceInfo()
@@ -101,7 +124,8 @@ class Shared:
         """Perform initial refresh of all coordinators and setup device info.
 
         This method should be called once when a config entry is first loaded.
-        It fetches device metadata and performs initial coordinator refreshes.
+        It fetches device metadata and then refreshes all coordinators
+        concurrently.
 
         Raises:
             ConfigEntryNotReady: If initialization fails.
@@ -110,9 +134,21 @@ class Shared:
         async with detect_auth_failed():
             self.meta = await self.client.aggregate_meta()
 
-        await self.state_coord.async_config_entry_first_refresh()
-        await self.update_coord.async_config_entry_first_refresh()
-        await self.config_coord.async_config_entry_first_refresh()
+        # the coordinators use disjoint endpoints, so they can refresh concurrently.
+        # Each raises ConfigEntryNotReady / ConfigEntryAuthFailed on its own.
+        refreshes = [
+            asyncio.create_task(coord.async_config_entry_first_refresh())
+            for coord in (self.state_coord, self.update_coord, self.config_coord)
+        ]
+        try:
+            await asyncio.gather(*refreshes)
+        except BaseException:
+            # setup failed, don't keep polling the device with the remaining refreshes.
+            # Not a TaskGroup, which would wrap the error in an ExceptionGroup.
+            for refresh in refreshes:
+                refresh.cancel()
+            await asyncio.gather(*refreshes, return_exceptions=True)
+            raise
 
         try:
             await self._post_first_refresh()
@@ -121,9 +157,11 @@ class Shared:
             raise ConfigEntryNotReady() from exc
 
     async def async_shutdown(self) -> None:
-        await self.state_coord.async_shutdown()
-        await self.update_coord.async_shutdown()
-        await self.config_coord.async_shutdown()
+        await asyncio.gather(
+            self.state_coord.async_shutdown(),
+            self.update_coord.async_shutdown(),
+            self.config_coord.async_shutdown(),
+        )
 
     async def _post_first_refresh(self) -> None:
         mac_addr = dr.format_mac(self.meta.mac_address)
@@ -147,6 +185,9 @@ class Shared:
 
         self._first_refresh_done = True
 
+    def _client_generation(self) -> int:
+        return self.client.generation
+
     async def _fetch_state(self) -> api.AggState:
         async with detect_auth_failed():
             return await self.client.aggregate_state(
@@ -167,23 +208,101 @@ class Shared:
 
     async def _fetch_config(self) -> api.AggConfig:
         async with detect_auth_failed():
-            return await self.client.aggregate_config()
+            data = await self.client.aggregate_config()
+
+        # the config rarely changes, so poll less often the longer it stays the same
+        if data == self.config_coord.data:
+            self._config_unchanged_polls += 1
+        else:
+            self._config_unchanged_polls = 0
+        steps = 1 + self._config_unchanged_polls // CONFIG_COORD_BACKOFF_POLLS
+        self.config_coord.update_interval = min(
+            self.config_interval * steps,
+            max(self.config_interval, CONFIG_COORD_MAX_INTERVAL),
+        )
+        return data
+
+
+def single_flight[T](
+    fetch: Callable[[], Awaitable[T]], *, generation: Callable[[], int]
+) -> Callable[[], Awaitable[T]]:
+    """Wrap a fetch function so that overlapping calls share one invocation.
+
+    While a fetch is in flight, further calls await its result instead of
+    sending another round of requests to the device. A fetch is only shared
+    while the generation is unchanged, so a refresh requested after a write
+    to the device never gets the data from before the write. If the call
+    that started the fetch is cancelled, the waiting calls fetch again.
+
+    Args:
+        fetch: Coroutine function performing the actual fetch.
+        generation: Returns the current generation, which increases with
+            every write to the device.
+
+    Returns:
+        Coroutine function with the same result as `fetch`.
+    """
+    inflight: dict[int, asyncio.Future[T]] = {}
+
+    async def wrapper() -> T:
+        key = generation()
+        while (pending := inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task and task.cancelling()):
+                    raise
+
+        fut = inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fetch()
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except Exception as exc:
+            fut.set_exception(exc)
+            # mark the exception as retrieved in case nobody else is waiting
+            fut.exception()
+            raise
+        else:
+            fut.set_result(result)
+            return result
+        finally:
+            del inflight[key]
+
+    return wrapper
+
+
+class _DetectAuthFailed(contextlib.AbstractAsyncContextManager[None]):
+    """Stateless context manager behind `detect_auth_failed`.
+
+    A plain class instead of `contextlib.asynccontextmanager`, so entering it
+    on every coordinator tick doesn't create a new generator.
+    """
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is not None and issubclass(exc_type, api.AuthenticationFailed):
+            raise ConfigEntryAuthFailed from exc
 
 
-@contextlib.asynccontextmanager
-async def detect_auth_failed():
+_DETECT_AUTH_FAILED = _DetectAuthFailed()
+
+
+def detect_auth_failed() -> contextlib.AbstractAsyncContextManager[None]:
     """Context manager to detect authentication failures.
 
     Converts api.AuthenticationFailed exceptions to ConfigEntryAuthFailed
-    so Home Assistant can properly handle re-authentication flows.
-
-    Yields:
-        None
+    so Home Assistant can properly handle re-authentication flows. This is
+    needed even without configured credentials, since the device can start
+    requiring them at any time.
 
     Raises:
         ConfigEntryAuthFailed: If authentication fails during the context.
     """
-    try:
-        yield
-    except api.AuthenticationFailed:
-        raise ConfigEntryAuthFailed
+    return _DETECT_AUTH_FAILED
@@ -21,12 +21,12 @@ async def async_setup_entry(
 
     for category in shared.config_coord.data.values():
         for command in category.commands.values():
-            if command.get("type") == "boolean" and command.get("alterable", True):
+            if command.type == "boolean" and command.alterable is not False:
                 entities.append(
                     UserConfig(
                         shared,
                         category_key=category.key,
-                        command_key=command.get("command", ""),
+                        command_key=command.command,
                     )
                 )
 
@@ -36,7 +36,7 @@ async def async_setup_entry(
 class UserConfig(SwitchEntity, UserConfigEntity):
     @property
     def is_on(self) -> bool | None:
-        value = self.vzug_command.get("value")
+        value = self.vzug_command.value
         match value:
             case "true":
                 return True
@@ -1,7 +1,10 @@
+import asyncio
+import httpx
+import orjson
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 
-from custom_components.vzug.api import VZugApi
+from custom_components.vzug.api import Command, VZugApi, _parse_api_version
 
 
 @pytest.fixture
@@ -81,16 +84,19 @@ async def test_json_repair_with_valid_json(vzug_api):
 
     # Mock httpx response properly
     mock_response = MagicMock()
-    mock_response.json.return_value = valid_json
+    mock_response.content = valid_json.encode()
     mock_response.raise_for_status.return_value = None
 
-    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+    with (
+        patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get,
+        patch("json_repair.repair_json") as mock_repair,
+    ):
         mock_get.return_value = mock_response
 
         result = await vzug_api._command("ai", command="getDeviceStatus")
 
-        assert result == valid_json
-        mock_response.json.assert_called_once()
+        assert result == {"status": "idle", "value": 123}
+        mock_repair.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -103,9 +109,6 @@ async def test_json_repair_with_real_broken_device_status():
 
     # Mock httpx response that fails json() but has content
     mock_response = MagicMock()
-    mock_response.json.side_effect = ValueError(
-        "Expecting property name enclosed in double quotes"
-    )
     mock_response.content = broken_json.encode()
     mock_response.text = broken_json
     mock_response.raise_for_status.return_value = None
@@ -118,3 +121,222 @@ async def test_json_repair_with_real_broken_device_status():
 
         assert result is not None
         assert len(result) == 8
+
+
+@pytest.mark.asyncio
+async def test_large_payload_parsed_in_executor(vzug_api):
+    """Test that large responses are parsed off the event loop."""
+    ids = [{"id": i, "name": f"program {i}"} for i in range(500)]
+
+    mock_response = MagicMock()
+    mock_response.content = orjson.dumps(ids)
+    mock_response.raise_for_status.return_value = None
+
+    loop = asyncio.get_running_loop()
+    with (
+        patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get,
+        patch.object(
+            loop, "run_in_executor", wraps=loop.run_in_executor
+        ) as mock_executor,
+    ):
+        mock_get.return_value = mock_response
+
+        result = await vzug_api._command("hh", command="getAllProgramIds")
+
+        assert result == ids
+        mock_executor.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_commands_are_coalesced(vzug_api):
+    """Test that identical concurrent commands only hit the device once."""
+    mock_response = MagicMock()
+    mock_response.content = b'{"Status": "idle"}'
+    mock_response.raise_for_status.return_value = None
+
+    release = asyncio.Event()
+
+    async def slow_get(*args, **kwargs):
+        await release.wait()
+        return mock_response
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = slow_get
+
+        tasks = [
+            asyncio.create_task(vzug_api.get_device_status()),
+            asyncio.create_task(vzug_api.get_device_status()),
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        first, second = await asyncio.gather(*tasks)
+
+        assert first == second == {"Status": "idle"}
+        assert mock_get.call_count == 1
+        assert not vzug_api._inflight
+
+
+@pytest.mark.asyncio
+async def test_read_after_write_is_not_coalesced(vzug_api):
+    """Test that a read sent after a write doesn't share an older read."""
+    stale_response = MagicMock()
+    stale_response.content = b'{"value": "old"}'
+    fresh_response = MagicMock()
+    fresh_response.content = b'{"value": "new"}'
+    set_response = MagicMock()
+    set_response.status_code = 200
+
+    release = asyncio.Event()
+
+    async def fake_get(url, params, auth):
+        if params["command"].startswith("set"):
+            return set_response
+        if release.is_set():
+            return fresh_response
+        await release.wait()
+        return stale_response
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = fake_get
+
+        before = asyncio.create_task(vzug_api.get_command("Test"))
+        await asyncio.sleep(0)
+        await vzug_api.set_command("Test", "new")
+        release.set()
+        after = await vzug_api.get_command("Test")
+
+        assert (await before).value == "old"
+        assert after.value == "new"
+        assert mock_get.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesced_request_resent_when_owner_cancelled(vzug_api):
+    """Test that waiters don't inherit the cancellation of the request owner."""
+    mock_response = MagicMock()
+    mock_response.content = b'{"Status": "idle"}'
+
+    first_call = asyncio.Event()
+
+    async def fake_get(*args, **kwargs):
+        if not first_call.is_set():
+            first_call.set()
+            await asyncio.Event().wait()
+        return mock_response
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = fake_get
+
+        owner = asyncio.create_task(vzug_api.get_device_status())
+        await first_call.wait()
+        waiter = asyncio.create_task(vzug_api.get_device_status())
+        await asyncio.sleep(0)
+        owner.cancel()
+
+        assert await waiter == {"Status": "idle"}
+        assert owner.cancelled()
+        assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_aggregate_config_builds_tree(vzug_api):
+    """Test that aggregate_config assembles categories and their commands."""
+    commands = {
+        "cat1": ["cmdA", "cmdB"],
+        "cat2": ["cmdC"],
+    }
+
+    with (
+        patch.object(vzug_api, "list_categories", new_callable=AsyncMock) as mock_categories,
+        patch.object(vzug_api, "get_category", new_callable=AsyncMock) as mock_category,
+        patch.object(vzug_api, "list_commands", new_callable=AsyncMock) as mock_commands,
+        patch.object(vzug_api, "get_command", new_callable=AsyncMock) as mock_command,
+    ):
+        mock_categories.return_value = ["cat1", "cat2"]
+        mock_category.side_effect = lambda key: {"description": key.upper()}
+        mock_commands.side_effect = lambda key: commands[key]
+        mock_command.side_effect = lambda key: Command(command=key)
+
+        result = await vzug_api.aggregate_config()
+
+        assert list(result) == ["cat1", "cat2"]
+        assert result["cat1"].description == "CAT1"
+        assert result["cat1"].commands == {
+            "cmdA": Command(command="cmdA"),
+            "cmdB": Command(command="cmdB"),
+        }
+        assert result["cat2"].commands == {"cmdC": Command(command="cmdC")}
+
+
+@pytest.mark.asyncio
+async def test_get_command_builds_command(vzug_api):
+    """Test that get_command maps the response and drops unknown keys."""
+    raw = {
+        "type": "range",
+        "command": "brightness",
+        "value": "3",
+        "minMax": ["1", "5"],
+        "unknownKey": True,
+    }
+
+    with patch.object(vzug_api, "_command", new_callable=AsyncMock) as mock_command:
+        mock_command.return_value = raw
+
+        result = await vzug_api.get_command("brightness")
+
+        assert result == Command(
+            type="range", command="brightness", value="3", minMax=["1", "5"]
+        )
+        assert result.alterable is None
+
+
+def test_parse_api_version():
+    """Test api version parsing including malformed versions."""
+    assert _parse_api_version("1.7.0") == (1, 7, 0)
+    assert _parse_api_version("1.10") == (1, 10)
+    assert _parse_api_version("1.7.0-beta") == (1, 7)
+    assert _parse_api_version("") == ()
+
+
+@pytest.mark.asyncio
+async def test_aggregate_meta_falls_back_without_device_info(vzug_api):
+    """Test that aggregate_meta uses the AI data when getDeviceInfo is unsupported."""
+    not_found = MagicMock()
+    not_found.status_code = 404
+
+    with (
+        patch.object(vzug_api, "get_mac_address", new_callable=AsyncMock) as mock_mac,
+        patch.object(vzug_api, "get_device_status", new_callable=AsyncMock) as mock_status,
+        patch.object(vzug_api, "get_model_description", new_callable=AsyncMock) as mock_model,
+        patch.object(vzug_api, "get_ai_fw_version", new_callable=AsyncMock) as mock_ai_fw,
+        patch.object(vzug_api, "get_device_info", new_callable=AsyncMock) as mock_device_info,
+    ):
+        mock_mac.return_value = "00:11:22:33:44:55"
+        mock_status.return_value = {"DeviceName": "Oven", "Serial": "123"}
+        mock_model.return_value = "Combair"
+        mock_ai_fw.return_value = {"apiVersion": "1.6.0"}
+        mock_device_info.side_effect = httpx.HTTPStatusError(
+            "Not Found", request=MagicMock(), response=not_found
+        )
+
+        result = await vzug_api.aggregate_meta()
+
+        assert result.model_name == "Combair"
+        assert result.device_name == "Oven"
+        assert result.serial_number == "123"
+        assert result.api_version == (1, 6, 0)
+
+
+@pytest.mark.asyncio
+async def test_set_program_serializes_options(vzug_api):
+    """Test that set_program sends the options as compact JSON."""
+    with patch.object(vzug_api, "_command", new_callable=AsyncMock) as mock_command:
+        await vzug_api.set_program(50, {"steamfinish": True})
+
+        mock_command.assert_called_once_with(
+            "hh",
+            command="setProgram",
+            params={"value": '{"steamfinish":true,"id":50}'},
+            raw=True,
+            attempts=2,
+        )
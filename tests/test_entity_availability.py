@@ -1,10 +1,11 @@
 """Tests for entity availability checks."""
 
 import pytest
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime, UTC
 
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.const import EntityCategory
 
 from custom_components.vzug.sensor import Program
 from custom_components.vzug.helpers import UserConfigEntity
@@ -15,35 +16,45 @@ import custom_components.vzug.api as api
 from yarl import URL
 
 
+def _mock_coordinator(data):
+    """Create a minimal stand-in for a DataUpdateCoordinator.
+
+    Much cheaper than `MagicMock(spec=DataUpdateCoordinator)`, which builds
+    child mocks for the whole class.
+    """
+    return SimpleNamespace(
+        last_update_success=True,
+        data=data,
+        async_add_listener=lambda update_callback, context=None: lambda: None,
+        async_request_refresh=AsyncMock(),
+    )
+
+
 @pytest.fixture
 def mock_shared():
     """Create a mock Shared object for testing."""
-    hass = MagicMock(spec=HomeAssistant)
+    hass = MagicMock()
     base_url = URL("http://example.com")
     shared = Shared(hass, base_url, None)
     
     # Mock coordinators with successful updates
-    shared.state_coord = MagicMock(spec=DataUpdateCoordinator)
-    shared.state_coord.last_update_success = True
-    shared.state_coord.data = api.AggState(
-        zh_mode=-1,
-        device={"Program": "Eco", "Status": "Running"},
-        device_fetched_at=datetime.now(UTC),
-        notifications=[],
-        eco_info={},
+    shared.state_coord = _mock_coordinator(
+        api.AggState(
+            zh_mode=-1,
+            device={"Program": "Eco", "Status": "Running"},
+            device_fetched_at=datetime.now(UTC),
+            notifications=[],
+            eco_info={},
+        )
     )
-    
-    shared.update_coord = MagicMock(spec=DataUpdateCoordinator)
-    shared.update_coord.last_update_success = True
-    shared.update_coord.data = api.AggUpdateStatus(
-        update={},
-        ai_fw_version={"SW": "1.0.0"},
-        hh_fw_version={},
+    shared.update_coord = _mock_coordinator(
+        api.AggUpdateStatus(
+            update={},
+            ai_fw_version={"SW": "1.0.0"},
+            hh_fw_version={},
+        )
     )
-    
-    shared.config_coord = MagicMock(spec=DataUpdateCoordinator)
-    shared.config_coord.last_update_success = True
-    shared.config_coord.data = {}
+    shared.config_coord = _mock_coordinator({})
     
     shared.unique_id_prefix = "00:11:22:33:44:55"
     shared.device_info = {}
@@ -121,10 +132,52 @@ def test_user_config_entity_unavailable_when_failed(mock_shared):
     entity = UserConfigEntity(
         mock_shared, category_key="CATEGORY_0", command_key="test_command"
     )
-    
+
     assert entity.available is False
 
 
+def _config_with_command(command):
+    return {
+        "CATEGORY_0": api.AggCategory(
+            key="CATEGORY_0",
+            description="Test Category",
+            commands={"test_command": command},
+        )
+    }
+
+
+def test_user_config_entity_refreshed_on_coordinator_update(mock_shared):
+    """Test that name, category and command follow the coordinator data."""
+    mock_shared.config_coord.data = _config_with_command(
+        api.Command(description="Old name", alterable=False)
+    )
+    entity = UserConfigEntity(
+        mock_shared, category_key="CATEGORY_0", command_key="test_command"
+    )
+    assert entity.name == "Old name"
+    assert entity.entity_category is EntityCategory.DIAGNOSTIC
+
+    with patch.object(entity, "async_write_ha_state") as mock_write:
+        new_command = api.Command(description="New name", alterable=True)
+        mock_shared.config_coord.data = _config_with_command(new_command)
+        entity._handle_coordinator_update()
+
+        assert entity.vzug_command is new_command
+        assert entity.name == "New name"
+        assert entity.entity_category is EntityCategory.CONFIG
+
+        # without a description the command key is used as the name
+        new_command = api.Command(alterable=None)
+        mock_shared.config_coord.data = _config_with_command(new_command)
+        entity._handle_coordinator_update()
+
+        assert entity.vzug_command is new_command
+        assert entity.name == "test_command"
+        assert entity.entity_category is EntityCategory.DIAGNOSTIC
+
+        assert mock_write.call_count == 2
+
+
 def test_update_entity_available_when_successful(mock_shared):
     """Test that VZugUpdate entity is available when coordinator is successful."""
     entity = VZugUpdate(mock_shared)
@@ -18,15 +18,12 @@ async def test_authentication_error_raises_exception(vzug_api):
     """Test that HTTP 401 errors raise AuthenticationFailed exception."""
     mock_response = MagicMock()
     mock_response.status_code = httpx.codes.UNAUTHORIZED
+    mock_response.is_success = False
     mock_response.is_server_error = False
     mock_response.text = "Unauthorized"
 
-    error = httpx.HTTPStatusError(
-        "Unauthorized", request=MagicMock(), response=mock_response
-    )
-
     with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
-        mock_get.side_effect = error
+        mock_get.return_value = mock_response
 
         with pytest.raises(AuthenticationFailed):
             await vzug_api.get_device_status()
@@ -37,15 +34,12 @@ async def test_client_error_not_retried(vzug_api):
     """Test that client errors (4xx) are not retried."""
     mock_response = MagicMock()
     mock_response.status_code = httpx.codes.NOT_FOUND
+    mock_response.is_success = False
     mock_response.is_server_error = False
     mock_response.text = "Not Found"
 
-    error = httpx.HTTPStatusError(
-        "Not Found", request=MagicMock(), response=mock_response
-    )
-
     with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
-        mock_get.side_effect = error
+        mock_get.return_value = mock_response
 
         with pytest.raises(httpx.HTTPStatusError):
             await vzug_api.get_device_status()
@@ -59,15 +53,12 @@ async def test_server_error_retried(vzug_api):
     """Test that server errors (5xx) are retried."""
     mock_response = MagicMock()
     mock_response.status_code = httpx.codes.INTERNAL_SERVER_ERROR
+    mock_response.is_success = False
     mock_response.is_server_error = True
     mock_response.text = "Internal Server Error"
 
-    error = httpx.HTTPStatusError(
-        "Internal Server Error", request=MagicMock(), response=mock_response
-    )
-
     with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
-        mock_get.side_effect = error
+        mock_get.return_value = mock_response
 
         # Should raise after all retries
         with pytest.raises(httpx.HTTPStatusError):
@@ -98,14 +89,11 @@ async def test_default_on_error_returns_empty_dict(vzug_api):
     """Test that default_on_error=True returns empty dict on error."""
     mock_response = MagicMock()
     mock_response.status_code = httpx.codes.INTERNAL_SERVER_ERROR
+    mock_response.is_success = False
     mock_response.is_server_error = True
 
-    error = httpx.HTTPStatusError(
-        "Internal Server Error", request=MagicMock(), response=mock_response
-    )
-
     with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
-        mock_get.side_effect = error
+        mock_get.return_value = mock_response
 
         result = await vzug_api.get_device_status(default_on_error=True)
 
@@ -120,7 +108,6 @@ async def test_empty_response_handled(vzug_api):
     mock_response.content = b""
     mock_response.text = ""
     mock_response.raise_for_status.return_value = None
-    mock_response.json.side_effect = ValueError("No JSON content")
 
     with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
         mock_get.return_value = mock_response
@@ -128,7 +115,9 @@ async def test_empty_response_handled(vzug_api):
         result = await vzug_api._command("ai", command="test", expected_type=list)
 
         # Empty response should be treated as None, then empty list if expected_type is list
-        assert result == []
+        assert len(result) == 0
+        # the empty result is a shared immutable instance
+        assert result is await vzug_api._command("ai", command="test", expected_type=list)
 
 
 @pytest.mark.asyncio
@@ -140,7 +129,6 @@ async def test_json_repair_on_broken_json(vzug_api):
     mock_response.content = broken_json.encode()
     mock_response.text = broken_json
     mock_response.raise_for_status.return_value = None
-    mock_response.json.side_effect = ValueError("Invalid JSON")
 
     with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
         mock_get.return_value = mock_response
@@ -159,7 +147,7 @@ async def test_json_repair_on_broken_json(vzug_api):
 async def test_type_assertion_failure_retried(vzug_api):
     """Test that type assertion failures trigger retries."""
     mock_response = MagicMock()
-    mock_response.json.return_value = "not a dict"  # Wrong type
+    mock_response.content = b'"not a dict"'  # Wrong type
     mock_response.raise_for_status.return_value = None
 
     with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
@@ -180,17 +168,14 @@ async def test_value_on_err_callback(vzug_api):
     """Test that value_on_err callback is used when provided."""
     mock_response = MagicMock()
     mock_response.status_code = httpx.codes.INTERNAL_SERVER_ERROR
+    mock_response.is_success = False
     mock_response.is_server_error = True
 
-    error = httpx.HTTPStatusError(
-        "Internal Server Error", request=MagicMock(), response=mock_response
-    )
-
     def custom_error_handler():
         return {"custom": "default_value"}
 
     with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
-        mock_get.side_effect = error
+        mock_get.return_value = mock_response
 
         result = await vzug_api._command(
             "ai",
@@ -249,3 +234,197 @@ async def test_get_program_builds_program_objects(vzug_api):
         assert "starttime" in result[0].options
         assert "duration" in result[0].options
 
+
+
+@pytest.mark.asyncio
+async def test_set_command_retries_transport_error_once(vzug_api):
+    """Test that setters retry a transport error exactly once."""
+    mock_response = MagicMock()
+    mock_response.status_code = httpx.codes.OK
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = [httpx.TransportError("Connection failed"), mock_response]
+
+        await vzug_api.set_command("Brightness", "5")
+
+        assert mock_get.call_count == 2
+        mock_get.assert_called_with(
+            "http://example.com/hh",
+            params={"value": "5", "command": "setBrightness"},
+            auth=None,
+        )
+
+
+@pytest.mark.asyncio
+async def test_set_command_authentication_error(vzug_api):
+    """Test that setters raise AuthenticationFailed on HTTP 401."""
+    mock_response = MagicMock()
+    mock_response.status_code = httpx.codes.UNAUTHORIZED
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = mock_response
+
+        with pytest.raises(AuthenticationFailed):
+            await vzug_api.do_command_action("Start")
+
+        assert mock_get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_unsupported_command_bypasses_default(vzug_api):
+    """Test that 404 errors are raised immediately even with default_on_error."""
+    mock_response = MagicMock()
+    mock_response.status_code = httpx.codes.NOT_FOUND
+    mock_response.is_success = False
+    mock_response.is_server_error = False
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = mock_response
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await vzug_api.get_device_info(default_on_error=True)
+
+        assert mock_get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_server_error_response_retried(vzug_api):
+    """Test that 5xx responses are retried and raised once attempts run out."""
+    mock_response = MagicMock()
+    mock_response.status_code = httpx.codes.SERVICE_UNAVAILABLE
+    mock_response.is_success = False
+    mock_response.is_server_error = True
+    mock_response.text = ""
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = mock_response
+
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            await vzug_api._command(
+                "ai", command="getDeviceStatus", attempts=2, retry_delay=0
+            )
+
+        assert exc_info.value.response is mock_response
+        assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_unsupported_command_not_requested_again(vzug_api):
+    """Test that commands answered with 404 fail locally on later calls."""
+    mock_response = MagicMock()
+    mock_response.status_code = httpx.codes.NOT_FOUND
+    mock_response.is_success = False
+    mock_response.is_server_error = False
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = mock_response
+
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await vzug_api.get_all_program_ids()
+
+        assert mock_get.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_not_found_requested_again_for_required_commands(vzug_api):
+    """Test that only optional commands are remembered as unsupported."""
+    mock_response = MagicMock()
+    mock_response.status_code = httpx.codes.NOT_FOUND
+    mock_response.is_success = False
+    mock_response.is_server_error = False
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = mock_response
+
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await vzug_api.list_categories()
+
+        assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_firmware_update_forgets_unsupported_commands(vzug_api):
+    """Test that unsupported commands are requested again after a firmware update."""
+    not_found = MagicMock()
+    not_found.status_code = httpx.codes.NOT_FOUND
+    not_found.is_success = False
+    not_found.is_server_error = False
+    ok = MagicMock()
+    ok.status_code = httpx.codes.OK
+    ok.content = b"[1, 2]"
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.return_value = not_found
+        with pytest.raises(httpx.HTTPStatusError):
+            await vzug_api.get_all_program_ids()
+
+        mock_get.return_value = ok
+        await vzug_api.do_hhg_update()
+
+        assert await vzug_api.get_all_program_ids() == [1, 2]
+        assert mock_get.call_count == 3
+
+
+def _response(status_code, content=b""):
+    response = MagicMock()
+    response.status_code = status_code
+    response.is_success = status_code < 300
+    response.is_server_error = status_code >= 500
+    response.content = content
+    response.text = content.decode()
+    return response
+
+
+@pytest.mark.asyncio
+async def test_aggregate_meta_falls_back_when_device_info_not_implemented(vzug_api):
+    """Test that a 501 for getDeviceInfo falls back to the AI module data."""
+    responses = {
+        ("ai", "getMacAddress"): _response(200, b"00:11:22:33:44:55"),
+        ("ai", "getDeviceStatus"): _response(200, b'{"DeviceName": "Dish", "Serial": "123"}'),
+        ("ai", "getModelDescription"): _response(200, b"Adora"),
+        ("ai", "getFWVersion"): _response(200, b'{"apiVersion": "1.7.0"}'),
+        ("hh", "getDeviceInfo"): _response(httpx.codes.NOT_IMPLEMENTED),
+    }
+
+    async def fake_get(url, params, auth):
+        return responses[url.rsplit("/", 1)[-1], params["command"]]
+
+    with patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get:
+        mock_get.side_effect = fake_get
+
+        meta = await vzug_api.aggregate_meta()
+
+    assert meta.model_name == "Adora"
+    assert meta.serial_number == "123"
+    assert meta.api_version == (1, 7, 0)
+
+
+@pytest.mark.asyncio
+async def test_aggregate_state_defaults_when_eco_info_not_implemented(vzug_api):
+    """Test that a 501 for a state endpoint is retried and then defaulted."""
+    responses = {
+        "getDeviceStatus": _response(200, b'{"Status": "idle"}'),
+        "getLastPUSHNotifications": _response(200, b"[]"),
+        "getEcoInfo": _response(httpx.codes.NOT_IMPLEMENTED),
+    }
+
+    async def fake_get(url, params, auth):
+        return responses[params["command"]]
+
+    with (
+        patch.object(vzug_api._client, "get", new_callable=AsyncMock) as mock_get,
+        patch("custom_components.vzug.api.asyncio.sleep", new_callable=AsyncMock),
+    ):
+        mock_get.side_effect = fake_get
+
+        state = await vzug_api.aggregate_state(default_on_error=True)
+
+    assert state.device == {"Status": "idle"}
+    assert state.eco_info == {}
+    eco_calls = [
+        call for call in mock_get.call_args_list
+        if call.kwargs["params"]["command"] == "getEcoInfo"
+    ]
+    assert len(eco_calls) == 5
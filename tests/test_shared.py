@@ -0,0 +1,174 @@
+"""Tests for the shared coordinator helpers."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from yarl import URL
+
+from custom_components.vzug import api
+from custom_components.vzug.shared import Shared, detect_auth_failed, single_flight
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_overlapping_calls():
+    """Test that overlapping calls share a single fetch."""
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    wrapped = single_flight(fetch, generation=lambda: 0)
+    tasks = [asyncio.create_task(wrapped()) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == [1, 1, 1]
+    assert calls == 1
+
+    # a call after the previous one finished fetches again
+    assert await wrapped() == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors():
+    """Test that all waiting callers receive the fetch error."""
+    release = asyncio.Event()
+
+    async def fetch() -> None:
+        await release.wait()
+        raise RuntimeError("boom")
+
+    wrapped = single_flight(fetch, generation=lambda: 0)
+    tasks = [asyncio.create_task(wrapped()) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_not_shared_across_generations():
+    """Test that a call after a write doesn't get the result of an older fetch."""
+    current_generation = 0
+    release = asyncio.Event()
+
+    async def fetch() -> int:
+        started_at = current_generation
+        await release.wait()
+        return started_at
+
+    wrapped = single_flight(fetch, generation=lambda: current_generation)
+    before = asyncio.create_task(wrapped())
+    await asyncio.sleep(0)
+    current_generation += 1
+    after = asyncio.create_task(wrapped())
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(before, after) == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_single_flight_fetches_again_when_owner_cancelled():
+    """Test that waiting calls don't inherit the cancellation of the first call."""
+    calls = 0
+    first_call = asyncio.Event()
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            first_call.set()
+            await asyncio.Event().wait()
+        return calls
+
+    wrapped = single_flight(fetch, generation=lambda: 0)
+    owner = asyncio.create_task(wrapped())
+    await first_call.wait()
+    waiter = asyncio.create_task(wrapped())
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    assert await waiter == 2
+    assert owner.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_config_interval_backs_off_while_unchanged():
+    """Test that the config coordinator polls less often while nothing changes."""
+    shared = Shared(MagicMock(), URL("http://example.com"), None)
+    config = {"cat": api.AggCategory(key="cat", description="", commands={})}
+    shared.config_coord.data = config
+
+    with patch.object(
+        shared.client, "aggregate_config", new_callable=AsyncMock
+    ) as mock_config:
+        mock_config.return_value = config
+        intervals = []
+        for _ in range(6):
+            await shared._fetch_config()
+            intervals.append(shared.config_coord.update_interval)
+
+        assert intervals == [timedelta(minutes=5)] * 2 + [timedelta(minutes=10)] * 3 + [
+            timedelta(minutes=15)
+        ]
+
+        # any change resets the interval
+        mock_config.return_value = {}
+        await shared._fetch_config()
+        assert shared.config_coord.update_interval == timedelta(minutes=5)
+
+
+@pytest.mark.asyncio
+async def test_failed_first_refresh_cancels_the_others():
+    """Test that a failing first refresh doesn't leave the others running."""
+    shared = Shared(MagicMock(), URL("http://example.com"), None)
+    started = asyncio.Event()
+    cancelled = []
+
+    async def pending_refresh() -> None:
+        try:
+            started.set()
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def failing_refresh() -> None:
+        await started.wait()
+        raise ConfigEntryNotReady
+
+    shared.state_coord = MagicMock(async_config_entry_first_refresh=pending_refresh)
+    shared.update_coord = MagicMock(async_config_entry_first_refresh=pending_refresh)
+    shared.config_coord = MagicMock(async_config_entry_first_refresh=failing_refresh)
+
+    with (
+        patch.object(shared.client, "aggregate_meta", new_callable=AsyncMock),
+        pytest.raises(ConfigEntryNotReady),
+    ):
+        await shared.async_config_entry_first_refresh()
+
+    assert cancelled == [True, True]
+
+
+@pytest.mark.asyncio
+async def test_detect_auth_failed_converts_authentication_errors():
+    """Test that only authentication failures are converted for reauth."""
+    with pytest.raises(ConfigEntryAuthFailed):
+        async with detect_auth_failed():
+            raise api.AuthenticationFailed
+
+    with pytest.raises(RuntimeError):
+        async with detect_auth_failed():
+            raise RuntimeError("boom")
+
+    async with detect_auth_failed():
+        pass